@@ -2,15 +2,18 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
-plt.matplotlib.rcParams["figure.dpi"] = 300
+import copy, pkg_resources, os, glob, pickle
+from functools import lru_cache
+
+# (set CHROMATIC_NO_RCPARAM_OVERRIDE to keep your own figure resolution)
+if not os.environ.get("CHROMATIC_NO_RCPARAM_OVERRIDE"):
+    plt.matplotlib.rcParams["figure.dpi"] = 300
 plt.rcParams["figure.constrained_layout.use"] = True
 
-import matplotlib.animation as ani
 import matplotlib.colors as col
 import matplotlib.cm as cm
 import matplotlib.gridspec as gs
 
-import copy, pkg_resources, os, glob, pickle
 from tqdm.auto import tqdm
 
 import warnings, textwrap
@@ -36,22 +39,57 @@ from astropy.visualization import quantity_support, simple_norm
 
 # slightly fancier visualization tools
 from matplotlib.gridspec import GridSpec, GridSpecFromSubplotSpec
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
+from matplotlib.cbook import normalize_kwargs
 
 from scipy.interpolate import interp1d
-from scipy.stats import median_absolute_deviation
+from scipy.stats import median_abs_deviation as median_absolute_deviation
 
-# For modelling transits.
-import batman
+from .units import *
 
-# For converting Rainbows to pandas dataframe
-import pandas as pd
+# (optional) for fusing elementwise array math into single passes
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+
+# (optional) for fast moving-window statistics along one axis
+try:
+    import bottleneck as bn
+except ImportError:
+    bn = None
+
+# (optional) for compiling a few loops, but numba is slow to import,
+# so it's only imported the first time a kernel needs compiling
+@lru_cache(maxsize=None)
+def _compile_with_numba(function):
+    """
+    Compile a function with `numba.njit(parallel=True, cache=True)`,
+    importing numba the first time this is called. Any `prange`
+    in the function's module will be set to numba's `prange`.
 
-from .units import *
+    Parameters
+    ----------
+    function : function
+        The (numba-compatible) function to compile.
 
-# For remove astrophysical signal
-from scipy.signal import savgol_filter, butter, filtfilt
-from scipy.signal import medfilt, convolve2d
-from scipy.ndimage import median_filter
+    Returns
+    -------
+    compiled : function, None
+        The compiled function, or None if numba can't be imported.
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+    function.__globals__["prange"] = prange
+    return njit(parallel=True, cache=True)(function)
+
+
+# (batman, pandas, matplotlib.animation, and scipy's signal/ndimage
+#  filters are slow to import and only needed by a few functions,
+#  so those functions import them where they're used)
 
 # define a driectory where we can put any necessary data files
 data_directory = pkg_resources.resource_filename("chromatic", "data")
@@ -84,13 +122,12 @@ def expand_filenames(filepath):
     """
     A wrapper to expand a string or list into a list of filenames.
     """
-    if type(filepath) == list:
-        filenames = filepath
+    if isinstance(filepath, list):
+        return sorted(filepath)
     elif "*" in filepath:
-        filenames = np.sort(glob.glob(filepath))
+        return sorted(glob.glob(filepath))
     else:
-        filenames = [filepath]
-    return sorted(filenames)
+        return [filepath]
 
 
 def name2color(name):
@@ -117,10 +154,14 @@ def name2color(name):
         return (0.0, 0.0, 0.0)
 
 
+@lru_cache(maxsize=128)
 def one2another(bottom="white", top="red", alpha_bottom=1.0, alpha_top=1.0, N=256):
     """
     Create a cmap that goes smoothly (linearly in RGBA) from "bottom" to "top".
 
+    The cmaps are cached, so asking again for the same one returns
+    the same object (please don't modify it in place).
+
     Parameters
     ----------
     bottom : str
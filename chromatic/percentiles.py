@@ -0,0 +1,118 @@
+"""
+Tools for quickly calculating percentiles of 2D
+arrays that might contain nans, along one axis.
+"""
+
+from .imports import *
+from .imports import _compile_with_numba
+
+# (numba's `prange` replaces this when the kernel is compiled)
+prange = range
+
+__all__ = ["nanpercentile"]
+
+# arrays with fewer elements than this use numpy, because importing
+# numba and loading the compiled kernel takes longer than it saves
+_use_numba_above = 50_000_000
+
+
+def nanpercentile(a, q, axis):
+    """
+    Calculate the percentile of a 2D array along an axis,
+    ignoring nans. This gives the same results as
+    `np.nanpercentile` (with its default linear interpolation),
+    but it uses a compiled `numba` kernel for very large arrays
+    when numba is available.
+
+    Parameters
+    ----------
+    a : np.array, astropy.units.Quantity
+        The 2D array for which percentiles should be calculated.
+    q : float
+        A number between 0 and 100, specifying the percentile.
+    axis : int
+        The axis along which the percentiles should be calculated.
+
+    Returns
+    -------
+    percentile : np.array, astropy.units.Quantity
+        The percentile of the array along the axis,
+        with the same units as the input array.
+    """
+
+    # fall back to numpy for anything our kernel doesn't handle
+    # (including invalid percentiles, for which numpy will raise errors)
+    if (np.ndim(a) != 2) or (np.ndim(q) != 0) or not (0 <= q <= 100):
+        return np.nanpercentile(a, q, axis=axis)
+
+    # (for all but the biggest arrays, numpy is quicker overall)
+    if np.size(a) < _use_numba_above:
+        return np.nanpercentile(a, q, axis=axis)
+
+    # (numba is optional; without it, we'll use numpy)
+    kernel = _compile_with_numba(_nanpercentile_of_rows)
+    if kernel is None:
+        return np.nanpercentile(a, q, axis=axis)
+
+    # separate the values from their units
+    unit = getattr(a, "unit", None)
+    values = np.asarray(getattr(a, "value", a), dtype=float)
+
+    # arrange the array so the percentile is calculated along rows
+    if axis in [1, -1]:
+        rows = np.ascontiguousarray(values)
+    elif axis in [0, -2]:
+        rows = np.ascontiguousarray(values.T)
+    else:
+        return np.nanpercentile(a, q, axis=axis)
+
+    percentile = kernel(rows, float(q))
+    if unit is None:
+        return percentile
+    else:
+        return percentile * unit
+
+
+def _nanpercentile_of_rows(a, q):
+    """
+    Calculate the percentile of each row of a 2D array, ignoring nans.
+
+    Parameters
+    ----------
+    a : np.array
+        The 2D array (with percentiles calculated along axis=1).
+    q : float
+        A number between 0 and 100, specifying the percentile.
+
+    Returns
+    -------
+    percentile : np.array
+        The percentile for each row.
+    """
+    nrows, ncolumns = a.shape
+    percentile = np.empty(nrows)
+    for i in prange(nrows):
+
+        # copy the finite values of this row into a scratch buffer
+        buffer = np.empty(ncolumns)
+        n = 0
+        for j in range(ncolumns):
+            if not np.isnan(a[i, j]):
+                buffer[n] = a[i, j]
+                n += 1
+        if n == 0:
+            percentile[i] = np.nan
+            continue
+
+        # find the two closest ranks (with a partial sort)
+        k = (n - 1) * q / 100
+        below = int(np.floor(k))
+        s = np.partition(buffer[:n], below)
+        if below < n - 1:
+            above = np.min(s[below + 1 :])
+        else:
+            above = s[below]
+
+        # interpolate linearly between them
+        percentile[i] = s[below] + (above - s[below]) * (k - below)
+    return percentile
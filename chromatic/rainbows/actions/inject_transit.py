@@ -1,5 +1,4 @@
 from ...imports import *
-import batman
 
 __all__ = ["inject_transit"]
 
@@ -83,6 +82,8 @@ def inject_transit(self, planet_radius=0.1, **planet_params):
             print("Warning: " + str(key) + " not a valid parameter")
 
     # Initialize batman model.
+    import batman
+
     params = batman.TransitParams()
     params.t0 = defaults["t0"]
     params.per = defaults["per"]
@@ -1,4 +1,5 @@
 from ...imports import *
+from ...percentiles import *
 
 __all__ = ["normalize", "_is_probably_normalized"]
 
@@ -40,7 +41,7 @@ def normalize(self, axis="wavelength", percentile=50):
         warnings.simplefilter("ignore")
 
         if axis.lower()[0] == "w":
-            normalization = np.nanpercentile(new.flux, percentile, axis=self.timeaxis)
+            normalization = nanpercentile(new.flux, percentile, axis=self.timeaxis)
             for k in self._keys_that_respond_to_math:
                 new.fluxlike[k] = new.get(k) / normalization[:, np.newaxis]
             try:
@@ -50,7 +51,7 @@ def normalize(self, axis="wavelength", percentile=50):
             except ValueError:
                 pass
         elif axis.lower()[0] == "t":
-            normalization = np.nanpercentile(self.flux, percentile, axis=self.waveaxis)
+            normalization = nanpercentile(self.flux, percentile, axis=self.waveaxis)
             for k in self._keys_that_respond_to_math:
                 new.fluxlike[k] = new.get(k) / normalization[np.newaxis, :]
             try:
@@ -75,19 +76,29 @@ def _is_probably_normalized(
     """
 
     # was there a normalization step?
-    is_normalized = "normalize" in self.history()
+    if "normalize" in self.history():
+        return True
 
-    # are values generally close to 1?
-    spectrum = self.get_average_spectrum()
+    # are values generally close to 1, relative to the noise?
+    spectrum_value = u.Quantity(self.get_average_spectrum()).value
+    deviation = np.abs(spectrum_value - 1)
     sigma = np.maximum(
         u.Quantity(self.get_expected_uncertainty()).value,
         u.Quantity(self.get_measured_scatter(method="MAD")).value,
     )
-    try:
-        sigma_value = u.Quantity(sigma).value
-        spectrum_value = u.Quantity(spectrum).value
-        assert np.any(sigma_value > 0)
-        is_close = np.nanpercentile(np.abs(spectrum_value - 1) / sigma, 95) < 5
-    except AssertionError:
-        is_close = np.nanpercentile(np.abs(spectrum_value - 1), 95) < 0.1
-    return is_normalized or is_close
+    if np.any(sigma > 0):
+        deviation, threshold = deviation / sigma, 5
+    else:
+        threshold = 0.1
+
+    # compare the 95th percentile to the threshold (with a partial sort,
+    # interpolating between the two closest ranks like np.nanpercentile)
+    deviation = deviation[np.isnan(deviation) == False]
+    if len(deviation) == 0:
+        return False
+    k = 0.95 * (len(deviation) - 1)
+    below = int(k)
+    above = min(below + 1, len(deviation) - 1)
+    s = np.partition(deviation, [below, above])
+    percentile = s[below] + (s[above] - s[below]) * (k - below)
+    return bool(percentile < threshold)
@@ -1,5 +1,31 @@
 from ...imports import *
 
+# derivatives of z = operation(x, y) with respect to x and y, for
+# propagating uncertainties (x = self, y = other)
+_derivatives = {
+    np.add: (lambda x, y: 1, lambda x, y: 1),
+    np.subtract: (lambda x, y: 1, lambda x, y: -1),
+    np.multiply: (lambda x, y: y, lambda x, y: x),
+    np.true_divide: (lambda x, y: 1 / y, lambda x, y: -x / y**2),
+}
+
+# expressions for each operation itself, for evaluating with numexpr
+_expressions = {
+    np.add: "x + y",
+    np.subtract: "x - y",
+    np.multiply: "x * y",
+    np.true_divide: "x / y",
+}
+
+# fused expressions for propagating uncertainties through each operation
+# (x = self, y = other, sx = uncertainty on x, sy = uncertainty on y)
+_uncertainty_expressions = {
+    np.add: "sqrt(sx**2 + sy**2)",
+    np.subtract: "sqrt(sx**2 + sy**2)",
+    np.multiply: "sqrt((sx * y)**2 + (sy * x)**2)",
+    np.true_divide: "sqrt((sx / y)**2 + (sy * x / y**2)**2)",
+}
+
 
 def _is_probably_rainbow(x):
     """
@@ -73,13 +99,12 @@ def _broadcast_to_fluxlike(self, x):
         )
 
 
-def _apply_operation(self, other, operation, dzdx="1", dzdy="1"):
+def _apply_operation(self, other, operation):
     """
     Apply a mathematical operation between `self` (x) and `other` (y)
     that returns a new Rainbow where the `flux` (and maybe `model`)
     are the result of the operation (+, -, *, /). Uncertainties
-    will be propagated using the string expressions for the required
-    derivatives.
+    will be propagated using the derivatives of the operation.
 
     Parameters
     ----------
@@ -94,16 +119,8 @@ def _apply_operation(self, other, operation, dzdx="1", dzdy="1"):
             5) Rainbow other with same dimensions as self.
     operation : function
         The function that will be applied to combine `self` and `other`.
-        Likely options are `np.add`, `np.subtract`, `np.multiply`, and
+        It must be one of `np.add`, `np.subtract`, `np.multiply`, or
         `np.true_divide`.
-    dzdx : string
-        For propagating uncertainties, if z(x,y) is the result,
-        what is `dz/dx`? This must be supplied as a string that
-        uses the variables `x` (= `self`) and `y` (= `other`).
-    dzdy : string
-        For propagating uncertainties, if z(x,y) is the result,
-        what is `dz/dy`? This must be supplied as a string that
-        uses the variables `x` (= `self`) and `y` (= `other`).
     """
     # create new Rainbow() to store results in.
     result = self._create_copy()
@@ -112,7 +129,9 @@ def _apply_operation(self, other, operation, dzdx="1", dzdy="1"):
     if _is_probably_rainbow(other):
         if _do_rainbows_match(self, other):
             for k in self._keys_that_respond_to_math:
-                result.fluxlike[k] = operation(self.fluxlike[k], other.fluxlike[k])
+                result.fluxlike[k] = _operate(
+                    operation, self.fluxlike[k], other.fluxlike[k], result.fluxlike[k]
+                )
         else:
             raise ValueError(
                 f"The two Rainbow objects {self} and {other} don't share wavelength/time axes."
@@ -127,7 +146,9 @@ def _apply_operation(self, other, operation, dzdx="1", dzdy="1"):
         y = self._broadcast_to_fluxlike(other)
         sigma_y = 0
         for k in self._keys_that_respond_to_math:
-            result.fluxlike[k] = operation(self.fluxlike[k], y)
+            result.fluxlike[k] = _operate(
+                operation, self.fluxlike[k], y, result.fluxlike[k]
+            )
 
     sigma_x = self.uncertainty
     x = self.get("model")
@@ -135,20 +156,96 @@ def _apply_operation(self, other, operation, dzdx="1", dzdy="1"):
         x = self.flux
 
     # If z = operation(x,y), then to propagate errors we need
-    # to use the derivatives of z with respect to x (dz/dx) and y (dz/dy):
-    # print(f"mean(x) = {np.mean(x)}")
-    # print(f"mean(sigma_x) = {np.mean(sigma_x)}")
-    # print(f"dzdx = {dzdx}")
-    # print(f"mean(y) = {np.mean(y)}")
-    # print(f"mean(sigma_y) = {np.mean(sigma_y)}")
-    # print(f"dzdy = {dzdy}")
-
-    variance = sigma_x**2 * eval(dzdx) ** 2 + sigma_y**2 * eval(dzdy) ** 2
-    result.fluxlike["uncertainty"] = np.sqrt(variance)
+    # to use the derivatives of z with respect to x (dz/dx) and y (dz/dy)
+    # (if possible, do it all in one pass through memory with numexpr)
+    # (and when possible, write into the uncertainty array already in `result`)
+    inputs = dict(x=x, y=y, sx=sigma_x, sy=sigma_y)
+    can_fuse = not any([isinstance(v, u.Quantity) for v in inputs.values()])
+    buffer = result.fluxlike["uncertainty"]
+    dzdx, dzdy = _derivatives[operation]
+    if np.ndim(y) == 0:
+        # for a scalar `other`, dz/dx is also a scalar and sigma_y = 0
+        scale = np.abs(dzdx(x, y))
+        result.fluxlike["uncertainty"] = np.multiply(
+            sigma_x, scale, **_out(buffer, sigma_x, scale)
+        )
+    elif (ne is not None) and can_fuse:
+        result.fluxlike["uncertainty"] = ne.evaluate(
+            _uncertainty_expressions[operation],
+            local_dict=inputs,
+            **_out(buffer, *inputs.values()),
+        )
+    else:
+        variance = sigma_x**2 * dzdx(x, y) ** 2 + sigma_y**2 * dzdy(x, y) ** 2
+        result.fluxlike["uncertainty"] = np.sqrt(variance, **_out(buffer, variance))
 
     return result
 
 
+def _operate(operation, x, y, buffer):
+    """
+    Calculate `operation(x, y)`, with numexpr if it's available
+    (and the inputs are plain double-precision arrays), and
+    writing into `buffer` whenever that's possible.
+
+    Parameters
+    ----------
+    operation : function
+        One of `np.add`, `np.subtract`, `np.multiply`, or `np.true_divide`.
+    x : array, u.Quantity
+        The first input.
+    y : array, u.Quantity, float, int
+        The second input.
+    buffer : np.array
+        The array into which we'd like to write the result.
+
+    Returns
+    -------
+    z : array, u.Quantity
+        The result of the operation.
+    """
+    out = _out(buffer, x, y)
+    plain = all([(type(v) == np.ndarray) or np.isscalar(v) for v in [x, y]])
+    if (ne is None) or (plain == False) or (np.result_type(x, y) != np.float64):
+        return operation(x, y, **out)
+    return ne.evaluate(_expressions[operation], local_dict=dict(x=x, y=y), **out)
+
+
+def _out(buffer, *inputs):
+    """
+    Decide whether the result of some elementwise math on `inputs`
+    can be written directly into a preallocated `buffer`.
+
+    Parameters
+    ----------
+    buffer : np.array
+        The array into which we'd like to write the result.
+    inputs : list
+        The inputs to the elementwise math.
+
+    Returns
+    -------
+    out : dict
+        Either `dict(out=buffer)`, if the buffer is a writeable
+        array with the right shape and data type, or an empty
+        dictionary otherwise (to be passed as `**out`).
+    """
+    if type(buffer) != np.ndarray:
+        return {}
+    if (buffer.flags.writeable == False) or (buffer.flags.c_contiguous == False):
+        return {}
+    if any([isinstance(x, u.Quantity) for x in inputs]):
+        return {}
+    try:
+        shape = np.broadcast_shapes(*[np.shape(x) for x in inputs])
+        dtype = np.result_type(*inputs)
+    except (ValueError, TypeError):
+        return {}
+    if (shape != buffer.shape) or (dtype != buffer.dtype) or (dtype.kind != "f"):
+        return {}
+    return dict(out=buffer)
+
+
 def __add__(self, other):
     """
     Add the flux of a rainbow and an input array (or another rainbow)
@@ -175,7 +272,7 @@ def __add__(self, other):
     h = self._create_history_entry("+", locals())
 
     # calculate a new Rainbow using the operation and error propagation
-    result = self._apply_operation(other, operation=np.add, dzdx="1", dzdy="1")
+    result = self._apply_operation(other, operation=np.add)
 
     # append the history entry to the new Rainbow
     result._record_history_entry(h)
@@ -208,7 +305,7 @@ def __sub__(self, other):
     h = self._create_history_entry("-", locals())
 
     # calculate a new Rainbow using the operation and error propagation
-    result = self._apply_operation(other, operation=np.subtract, dzdx="1", dzdy="1")
+    result = self._apply_operation(other, operation=np.subtract)
 
     # append the history entry to the new Rainbow
     result._record_history_entry(h)
@@ -242,7 +339,7 @@ def __mul__(self, other):
     h = self._create_history_entry("*", locals())
 
     # calculate a new Rainbow using the operation and error propagation
-    result = self._apply_operation(other, operation=np.multiply, dzdx="y", dzdy="x")
+    result = self._apply_operation(other, operation=np.multiply)
 
     # append the history entry to the new Rainbow
     result._record_history_entry(h)
@@ -275,9 +372,7 @@ def __truediv__(self, other):
     h = self._create_history_entry("/", locals())
 
     # calculate a new Rainbow using the operation and error propagation
-    result = self._apply_operation(
-        other, operation=np.true_divide, dzdx="1/y", dzdy="-x/y**2"
-    )
+    result = self._apply_operation(other, operation=np.true_divide)
 
     # append the history entry to the new Rainbow
     result._record_history_entry(h)
@@ -291,36 +386,56 @@ def __eq__(self, other):
     This compares the wavelike, timelike, and fluxlike arrays
     for exact matches. It skips entirely over the metadata.
     """
-    # start by assuming the Rainbows are identical
-    same = True
 
-    for a, b in zip([self, other], [other, self]):
+    # loop through the core dictionaries
+    for d in self._core_dictionaries:
+        if d == "metadata":
+            continue
 
-        # loop through the core dictionaries
-        for d in a._core_dictionaries:
-            if d == "metadata":
+        # pull out each core dictionary from both
+        d1, d2 = vars(self)[d], vars(other)[d]
+        if set(d1.keys()) != set(d2.keys()):
+            return False
+
+        # loop through elements of each dictionary
+        for k in d1:
+
+            # ignore different histories (e.g. new vs loaded)
+            if k == "history":
                 continue
-            # pull out each core dictionary from both
-            d1, d2 = vars(self)[d], vars(b)[d]
-            same *= set(d1.keys()) == set(d2.keys())
 
-            # loop through elements of each dictionary
-            for k in d1:
+            # test that all elements match for both (stopping at the first mismatch)
+            if d == "fluxlike":
+                for a, b in zip([self, other], [other, self]):
+                    ok = a.ok.astype(bool)
+                    if not _are_close(a.get(k)[ok], b.get(k)[ok]):
+                        return False
+            elif not _are_close(self.get(k), other.get(k)):
+                return False
 
-                # ignore different histories (e.g. new vs loaded)
-                if k != "history":
+    return True
+
+
+def _are_close(a, b):
+    """
+    Check whether two arrays match, first trying a cheap exact
+    comparison and then falling back to `np.isclose`.
 
-                    # test that all elements match for both
-                    if d == "fluxlike":
-                        same *= np.all(
-                            np.isclose(
-                                a.get(k)[a.ok.astype(bool)], b.get(k)[a.ok.astype(bool)]
-                            )
-                        )
-                    else:
-                        same *= np.all(np.isclose(a.get(k), b.get(k)))
-
-    return bool(same)
+    Parameters
+    ----------
+    a : np.array
+        One array.
+    b : np.array
+        Another array.
+
+    Returns
+    -------
+    close : bool
+        Are all elements of the two arrays close to each other?
+    """
+    if np.shape(a) != np.shape(b):
+        return False
+    return bool(np.array_equal(a, b) or np.all(np.isclose(a, b)))
 
 
 def diff(self, other):
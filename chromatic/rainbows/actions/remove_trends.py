@@ -1,4 +1,5 @@
 from ...imports import *
+from .operations import _out
 
 __all__ = ["remove_trends"]
 
@@ -62,7 +63,16 @@ def remove_trends(
     new = self._create_copy()
 
     if method == "differences":
-        new.flux = np.sqrt(2) * np.gradient(new.flux, axis=0) + 1
+        # (the same as np.gradient along wavelength, but without its temporaries)
+        f = new.flux
+        differences = np.empty_like(f)
+        np.subtract(f[2:], f[:-2], out=differences[1:-1])
+        differences[1:-1] *= 0.5
+        differences[0] = f[1] - f[0]
+        differences[-1] = f[-1] - f[-2]
+        differences *= np.sqrt(2)
+        differences += 1
+        new.fluxlike["flux"] = differences
 
     #    if method == "butter_highpass":
     #        for i in range (0,new.nwave):
@@ -89,8 +99,11 @@ def remove_trends(
             {kw_to_use}
             """
             )
-        medfilt = median_filter(new.flux, **kw_to_use)
-        new.flux = new.flux / medfilt
+        medfilt = _median_filter(new.flux, **kw_to_use)
+        # (divide in place when possible, since `new` has its own copy of flux)
+        new.fluxlike["flux"] = np.divide(
+            new.flux, medfilt, **_out(new.flux, new.flux, medfilt)
+        )
 
     if method == "savgol_filter":
         kw_to_use = dict(window_length=11, polyorder=1)
@@ -103,9 +116,13 @@ def remove_trends(
             {kw_to_use}
             """
             )
-        for i in range(new.nwave):
-            savgolfilter = savgol_filter(new.flux[i, :], **kw_to_use)
-            new.flux[i, :] = new.flux[i, :] / savgolfilter
+        # (filter all wavelengths at once, along the time axis)
+        from scipy.signal import savgol_filter
+
+        savgolfilter = savgol_filter(new.flux, axis=new.timeaxis, **kw_to_use)
+        new.fluxlike["flux"] = np.divide(
+            new.flux, savgolfilter, **_out(new.flux, new.flux, savgolfilter)
+        )
 
     if method == "custom":
         if "model" not in kw:
@@ -120,3 +137,47 @@ def remove_trends(
 
     # return the new Rainbow
     return new
+
+
+def _median_filter(flux, size=(1, 11), **kw):
+    """
+    A wrapper for `scipy.ndimage.median_filter` that uses
+    a fast 1D moving median from `bottleneck` (if it's
+    available) when the filter only extends along time.
+
+    Parameters
+    ----------
+    flux : np.array
+        The 2D (nwavelengths, ntimes) array to filter.
+    size : tuple
+        The (nwavelengths, ntimes) shape of the rectangle
+        used to select surrounding points for the median.
+    kw : dict
+        Any additional keywords will be passed to
+        `scipy.ndimage.median_filter` (and will
+        turn off the `bottleneck` fast path, as
+        will any nans in the flux).
+
+    Returns
+    -------
+    medfilt : np.array
+        The median-filtered 2D array.
+    """
+    # (scipy picks one of the middle values for even windows; bottleneck averages)
+    fast = (bn is not None) and (len(kw) == 0) and (np.shape(size) == (2,))
+    fast = fast and (isinstance(flux, u.Quantity) == False)
+    # (bottleneck skips nans, so leave those to scipy to keep results the same)
+    fast = fast and (np.isnan(np.sum(flux)) == False)
+    if (fast == False) or (size[0] != 1) or (size[1] % 2 == 0):
+        from scipy.ndimage import median_filter
+
+        return median_filter(flux, size=size, **kw)
+
+    # pad the edges the same way as the default `mode="reflect"`
+    window = size[1]
+    padded = np.pad(
+        np.asarray(flux, dtype=float), [(0, 0), (window // 2, window // 2)], "symmetric"
+    )
+
+    # a trailing moving median, which lines up with the centered one after padding
+    return bn.move_median(padded, window=window, axis=1, min_count=1)[:, window - 1 :]
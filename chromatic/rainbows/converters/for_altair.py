@@ -90,5 +90,7 @@ def to_df(self, t_unit="d", w_unit="micron"):
     }
 
     # convert to pandas dataframe
+    import pandas as pd
+
     df = pd.DataFrame(rainbow_dict)
     return df
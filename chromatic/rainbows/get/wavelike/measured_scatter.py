@@ -33,17 +33,26 @@ def get_measured_scatter(
         Please choose from ['MAD', 'standard-deviation'].
         """
         )
-    scatters = np.zeros(self.nwave)
-    for i in range(self.nwave):
-        x, y, sigma = self.get_ok_data_for_wavelength(
-            i, y=quantity, minimum_acceptable_ok=minimum_acceptable_ok
-        )
-        if u.Quantity(y).unit == u.Unit(""):
-            y_value, y_unit = y, 1
-        else:
-            y_value, y_unit = y.value, y.unit
+
+    # get the quantity for all wavelengths at once, with bad data as nan
+    y = self.get(quantity)
+    if u.Quantity(y).unit == u.Unit(""):
+        y_value, y_unit = y, 1
+    else:
+        y_value, y_unit = y.value, y.unit
+    ok = self.ok >= minimum_acceptable_ok
+    y_value = np.where(ok, y_value, np.nan)
+
+    # calculate the scatter for every wavelength in one pass
+    with warnings.catch_warnings():
+        # (don't complain about wavelengths with no good data)
+        warnings.simplefilter("ignore")
         if method == "standard-deviation":
-            scatters[i] = np.std(y_value)
+            scatters = np.nanstd(y_value, axis=self.timeaxis)
         elif method == "MAD":
-            scatters[i] = median_absolute_deviation(y_value, scale="normal")
+            scatters = median_absolute_deviation(
+                y_value, axis=self.timeaxis, scale="normal", nan_policy="omit"
+            )
+        else:
+            scatters = np.zeros(self.nwave)
     return scatters * y_unit
@@ -537,6 +537,8 @@ class MultiRainbow:
             return artists
 
         # make and save the animation
+        import matplotlib.animation as ani
+
         animator = ani.FuncAnimation(
             figure,
             update,
@@ -610,6 +612,8 @@ class MultiRainbow:
             return artists
 
         # make and save the animation
+        import matplotlib.animation as ani
+
         animator = ani.FuncAnimation(
             figure,
             update,
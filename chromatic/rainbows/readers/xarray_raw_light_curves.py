@@ -36,7 +36,7 @@
 
 # import the general list of packages
 from ...imports import *
-from ..writers.xarray_raw_light_curves import xr, json, chromatic_to_ers
+from ..writers.xarray_raw_light_curves import json, chromatic_to_ers
 
 ers_to_chromatic = {v: k for k, v in chromatic_to_ers.items()}
 
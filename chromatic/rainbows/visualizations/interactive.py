@@ -1,17 +1,5 @@
 from ...imports import *
 
-# don't make Altair a necessary part of chromatic
-try:
-    import altair as alt
-
-    alt.data_transformers.disable_max_rows()
-except Exception as e:
-    print(e)
-    warnings.warn(
-        "Issue importing Altair, cannot make interactive plot :(! \n \
-                  You can install Altair using: pip install altair"
-    )
-
 __all__ = ["imshow_interact"]
 
 
@@ -56,6 +44,18 @@ def imshow_interact(
         If the user wants to define their own ylimits on the lightcurve plot
     """
 
+    # don't make Altair a necessary part of chromatic (or of importing it)
+    try:
+        import altair as alt
+
+        alt.data_transformers.disable_max_rows()
+    except Exception as e:
+        print(e)
+        warnings.warn(
+            "Issue importing Altair, cannot make interactive plot :(! \n \
+                  You can install Altair using: pip install altair"
+        )
+
     # preset the x and y axes as Time (in units defined by the user) and Wavelength
     xlabel = f"Time ({t_unit})"
     ylabel = f"Wavelength ({w_unit})"
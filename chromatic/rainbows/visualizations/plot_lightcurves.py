@@ -57,13 +57,17 @@ def plot_lightcurves(
           linewidth, linestyle, zorder]` (and more)
         More details are available at
         https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.plot.html
+        (Lines connect each light curve's ok points, skipping over
+        any data that aren't ok, and they break at nan values.)
     errorbarkw : dict
-        A dictionary of keywords passed to `plt.errorbar`
-        so you can have more detailed control over the plot
-        appearance. Common keyword arguments might include:
-        `[alpha, elinewidth, color, zorder]` (and more)
-        More details are available at
-        https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.errorbar.html
+        A dictionary of keywords passed to the `LineCollection`
+        that draws all the error bars, so you can have more
+        detailed control over the plot appearance. Common keyword
+        arguments might include: `[alpha, elinewidth, color, zorder]`
+        (and more) More details are available at
+        https://matplotlib.org/stable/api/collections_api.html#matplotlib.collections.LineCollection
+        Keywords that only `plt.errorbar` understands (like
+        `capsize` or `fmt`) will be ignored, with a warning.
     textkw : dict
         A dictionary of keywords passed to `plt.text`
         so you can have more detailed control over the text
@@ -90,8 +94,6 @@ def plot_lightcurves(
 
     w_unit, t_unit = u.Unit(w_unit), u.Unit(t_unit)
 
-    min_time = np.nanmin(self.time.to_value(t_unit))
-
     # make sure ax is set up
     if ax is None:
         fi = plt.figure(
@@ -109,12 +111,28 @@ def plot_lightcurves(
             spacing = 3 * np.nanstd(self.get(quantity))
     ax._most_recent_chromatic_plot_spacing = spacing
 
+    # grab the quantity and uncertainty for all wavelengths at once
+    ok = self.ok >= minimum_acceptable_ok
+    plot_x = self.time.to_value(t_unit)
+    min_time = np.nanmin(plot_x)
+    offsets = -np.arange(self.nwave)[:, np.newaxis] * spacing
+    plot_y = np.where(ok, u.Quantity(self.get(quantity)).value, np.nan) + offsets
+    plot_sigma = np.where(ok, u.Quantity(self.get("uncertainty")).value, np.nan)
+    has_data = np.any(np.isfinite(plot_y), axis=1)
+
+    # get the colors for all wavelengths (and for all individual points)
+    colors = self.get_wavelength_color(self.wavelength)
+    point_colors = np.repeat(colors, self.ntime, axis=0)
+
     # TO-DO: check if this Rainbow has been normalized
     if self._is_probably_normalized():
-        label_y = "1 - (0.5 + i) * spacing"
+        label_y = 1 - (0.5 + np.arange(self.nwave)) * spacing
         ylim = 1 - np.array([self.nwave + 1, -1]) * spacing
     else:
-        label_y = "np.median(plot_y) - 0.5 * spacing"
+        with warnings.catch_warnings():
+            # (don't complain about light curves that are entirely nan)
+            warnings.simplefilter("ignore")
+            label_y = np.nanmedian(plot_y, axis=1) - 0.5 * spacing
         warnings.warn(
             """
             It's not clear if/how this object has been normalized.
@@ -122,59 +140,189 @@ def plot_lightcurves(
             be a little bit funny in .plot()."""
         )
         ylim = [None, None]
+
     with quantity_support():
 
-        #  loop through wavelengths
-        for i, w in enumerate(self.wavelength):
+        # flatten the points of all light curves into 1D arrays
+        flat_x = np.broadcast_to(plot_x, plot_y.shape).flatten()
+        flat_y = plot_y.flatten()
 
-            # grab the quantity and yerr for this particular wavelength
-            t, y, sigma = self.get_ok_data_for_wavelength(
-                i, minimum_acceptable_ok=minimum_acceptable_ok, y=quantity
+        if errorbar:
+            # set default for error bar lines (accepting `plt.errorbar` names)
+            this_errorbarkw = _errorbarkw_to_collection_keywords(
+                errorbarkw, colors=point_colors, linewidths=1, zorder=-1
             )
 
-            if np.any(np.isfinite(y)):
-
-                plot_x = t.to_value(t_unit)
-
-                # add an offset to this quantity
-                plot_y = -i * spacing + u.Quantity(y).value
-                plot_sigma = u.Quantity(sigma).value
+            # plot the error bars for all wavelengths as one set of vertical lines
+            flat_sigma = plot_sigma.flatten()
+            errorbar_segments = np.empty((len(flat_x), 2, 2))
+            errorbar_segments[:, 0, 0] = flat_x
+            errorbar_segments[:, 1, 0] = flat_x
+            errorbar_segments[:, 0, 1] = flat_y - flat_sigma
+            errorbar_segments[:, 1, 1] = flat_y + flat_sigma
+            ax.add_collection(LineCollection(errorbar_segments, **this_errorbarkw))
+            ax.autoscale_view()
 
-                # get the color for this quantity
-                color = self.get_wavelength_color(w)
+        # plot the data points (with offsets) for all wavelengths together
+        linekw, markerkw = _plotkw_to_collection_keywords(plotkw)
+        if linekw is not None:
+            this_linekw = dict(colors=colors[has_data])
+            this_linekw.update(**linekw)
+            # (connect each light curve's ok points, skipping over bad ones,
+            #  the same way drawing each one separately with `plt.plot` did)
+            segments = [
+                np.transpose([plot_x[ok[i]], plot_y[i, ok[i]]])
+                for i in np.nonzero(has_data)[0]
+            ]
+            ax.add_collection(LineCollection(segments, **this_linekw))
+            ax.autoscale_view()
+        if markerkw is not None:
+            this_markerkw = dict(color=point_colors)
+            this_markerkw.update(**markerkw)
+            plt.scatter(flat_x, flat_y, **this_markerkw)
 
-                # plot the data points (with offsets)
-                this_plotkw = dict(marker="o", linestyle="-", color=color)
-                this_plotkw.update(**plotkw)
-
-                # set default for error bar lines
-                this_errorbarkw = dict(
-                    color=color, linewidth=0, elinewidth=1, zorder=-1
-                )
-                this_errorbarkw.update(**errorbarkw)
-
-                if errorbar:
-                    plt.errorbar(
-                        plot_x,
-                        plot_y,
-                        yerr=plot_sigma,
-                        **this_errorbarkw,
-                    )
-                plt.plot(plot_x, plot_y, **this_plotkw)
-
-                # add text labels next to each quantity plot
-                this_textkw = dict(va="center", color=color)
+        # add text labels next to each quantity plot
+        if text:
+            # (convert the wavelengths and format their unit only once)
+            label_w = self.wavelength.to_value(w_unit)
+            label_unit = w_unit.to_string("latex_inline")
+            for i in np.nonzero(has_data)[0]:
+                this_textkw = dict(va="center", color=colors[i])
                 this_textkw.update(**textkw)
-                if text:
-                    plt.text(
-                        min_time,
-                        eval(label_y),
-                        f"{w.to_value(w_unit):.2f} {w_unit.to_string('latex_inline')}",
-                        **this_textkw,
-                    )
+                plt.text(
+                    min_time,
+                    label_y[i],
+                    f"{label_w[i]:.2f} {label_unit}",
+                    **this_textkw,
+                )
 
         # add text labels to the plot
         plt.xlabel(f"{self._time_label} ({t_unit.to_string('latex_inline')})")
         plt.ylabel("Relative Flux (+ offsets)")
         plt.ylim(*ylim)
     return ax
+
+
+def _plotkw_to_collection_keywords(plotkw={}):
+    """
+    Translate keywords meant for `plt.plot` into keywords
+    for one `LineCollection` (for the lines connecting
+    points) and one `plt.scatter` (for the markers), so
+    all light curves can be drawn with only two artists.
+
+    Parameters
+    ----------
+    plotkw : dict
+        A dictionary of keywords that would be passed
+        to `plt.plot` for an individual light curve.
+
+    Returns
+    -------
+    linekw : dict, None
+        Keywords for `LineCollection` (or None if no
+        lines should be drawn).
+    markerkw : dict, None
+        Keywords for `plt.scatter` (or None if no
+        markers should be drawn).
+    """
+
+    # set defaults for the plot and expand any aliases (like `ms`)
+    this_plotkw = dict(marker="o", linestyle="-", zorder=2)
+    this_plotkw.update(**normalize_kwargs(plotkw, Line2D))
+
+    # keywords that apply to both the lines and the markers
+    shared = {
+        k: this_plotkw.pop(k)
+        for k in ["color", "alpha", "zorder", "clip_on", "rasterized"]
+        if k in this_plotkw
+    }
+
+    # keywords for the lines connecting the points
+    linestyle = this_plotkw.pop("linestyle")
+    linewidth = this_plotkw.pop("linewidth", plt.matplotlib.rcParams["lines.linewidth"])
+    label = this_plotkw.pop("label", None)
+    if (linestyle in [None, "", " ", "none", "None"]) or (linewidth == 0):
+        linekw = None
+    else:
+        linekw = dict(linestyles=linestyle, linewidths=linewidth, label=label)
+        linekw.update(**shared)
+        if "color" in linekw:
+            linekw["colors"] = linekw.pop("color")
+
+    # keywords for the markers
+    marker = this_plotkw.pop("marker")
+    markersize = this_plotkw.pop(
+        "markersize", plt.matplotlib.rcParams["lines.markersize"]
+    )
+    if marker in [None, "", " ", "none", "None"]:
+        markerkw = None
+    else:
+        markerkw = dict(marker=marker, s=markersize**2)
+        for k, v in dict(
+            markerfacecolor="facecolors",
+            markeredgecolor="edgecolors",
+            markeredgewidth="linewidths",
+        ).items():
+            if k in this_plotkw:
+                markerkw[v] = this_plotkw.pop(k)
+        markerkw.update(**shared)
+
+    if len(this_plotkw) > 0:
+        warnings.warn(
+            f"""
+        The `plotkw` keyword(s) {list(this_plotkw.keys())}
+        can't be applied to all light curves at once,
+        so they are being ignored. Sorry!
+        """
+        )
+    return linekw, markerkw
+
+
+def _errorbarkw_to_collection_keywords(errorbarkw={}, **defaults):
+    """
+    Translate keywords meant for `plt.errorbar` into keywords
+    for the one `LineCollection` that draws all error bars.
+
+    Parameters
+    ----------
+    errorbarkw : dict
+        A dictionary of keywords that would be passed
+        to `plt.errorbar` for an individual light curve.
+    **defaults : dict
+        Default keywords for the `LineCollection`, which
+        will be overwritten by any in `errorbarkw`.
+
+    Returns
+    -------
+    collectionkw : dict
+        Keywords for `LineCollection`.
+    """
+
+    # translate the names `plt.errorbar` uses for the error bar lines
+    aliases = dict(
+        color="colors",
+        ecolor="colors",
+        elinewidth="linewidths",
+        linewidth="linewidths",
+        lw="linewidths",
+        linestyle="linestyles",
+        ls="linestyles",
+    )
+    collectionkw = dict(**defaults)
+    ignored = []
+    for k, v in errorbarkw.items():
+        k = aliases.get(k, k)
+        if hasattr(LineCollection, f"set_{k}"):
+            collectionkw[k] = v
+        else:
+            ignored.append(k)
+
+    if len(ignored) > 0:
+        warnings.warn(
+            f"""
+        The `errorbarkw` keyword(s) {ignored}
+        can't be applied to the error bars of all
+        light curves at once, so they are being ignored. Sorry!
+        """
+        )
+    return collectionkw
@@ -16,13 +16,7 @@ def plot_average_lightcurve(self, **kw):
         docstrings for options about plot appearance and layout.
     """
     y = self.get_average_lightcurve()
-    y_unit = u.Quantity(y).unit
-    if y_unit == u.Unit(""):
-        unit_string = "unitless"
-    else:
-        unit_string = y_unit.to_string("latex_inline")
-    if y_unit == "":
-        y_unit = "unitless"
+    unit_string = _get_unit_string(u.Quantity(y).unit)
     self._scatter_timelike_or_wavelike(
         x=self.time,
         y=y,
@@ -2,11 +2,45 @@ from ...imports import *
 
 __all__ = [
     "_add_panel_labels",
+    "_get_unit_string",
     "_get_animation_writer_and_displayer",
     "_scatter_timelike_or_wavelike",
 ]
 
 
+# the matplotlib writer (by name, so `matplotlib.animation` can be
+# imported only when needed) and advice for each animation file type
+_animation_writers = {
+    "html": "HTMLWriter",
+    "mp4": "FFMpegWriter",
+    "gif": "PillowWriter",
+}
+_animation_warnings = {
+    "html": "Please try `pip insall matplotlib --upgrade` and rerunning?",
+    "mp4": "Please try `conda install ffmpeg` and rerunning?",
+    "gif": "Please try `pip insall matplotlib --upgrade` and rerunning?",
+}
+
+
+@lru_cache(maxsize=1)
+def _get_animation_displayers():
+    """
+    Get the IPython objects that display each animation file type.
+    (This imports IPython only once, the first time it's needed.)
+    """
+    from IPython.display import HTML, Video, Image
+
+    return {"html": HTML, "mp4": Video, "gif": Image}
+
+
+# scatter plots with more points than this will be rasterized
+_rasterize_scatter_above = 5000
+
+# units against which to compare (so "m" and "s" are parsed only once)
+_METER = u.m
+_SECOND = u.s
+
+
 def _get_animation_writer_and_displayer(filename="animation.html", **kw):
     """
     Create the right animation writer based on filename.
@@ -23,22 +57,12 @@ def _get_animation_writer_and_displayer(filename="animation.html", **kw):
     displayer : ?
         The
     """
-
-    # define the options
-    writers = {"html": ani.HTMLWriter, "mp4": ani.FFMpegWriter, "gif": ani.PillowWriter}
-    warnings = {
-        "html": "Please try `pip insall matplotlib --upgrade` and rerunning?",
-        "mp4": "Please try `conda install ffmpeg` and rerunning?",
-        "gif": "Please try `pip insall matplotlib --upgrade` and rerunning?",
-    }
-    from IPython.display import HTML, Video, Image
-
-    displayers = {"html": HTML, "mp4": Video, "gif": Image}
+    import matplotlib.animation as ani
 
     # get the writer object
     suffix = filename.split(".")[-1]
-    writer = writers[suffix](**kw)
-    displayer = displayers[suffix]
+    writer = getattr(ani, _animation_writers[suffix])(**kw)
+    displayer = _get_animation_displayers()[suffix]
 
     if writer.isAvailable():
         return writer, displayer
@@ -46,18 +70,67 @@ def _get_animation_writer_and_displayer(filename="animation.html", **kw):
         raise ValueError(
             f"""
         The writer {writer} needed for your `.{suffix}` file is not available.
-        {warnings[k]}
+        {_animation_warnings[suffix]}
         """
         )
 
 
+@lru_cache(maxsize=64)
+def _get_unit_kind(unit):
+    """
+    Figure out whether a unit is for wavelength or time,
+    remembering the results (because checking the
+    equivalence of units isn't quick).
+
+    Parameters
+    ----------
+    unit : astropy.units.Unit
+        The unit to check.
+
+    Returns
+    -------
+    kind : str, None
+        "wavelength", "time", or None (if neither).
+    """
+    if unit.is_equivalent(_METER):
+        return "wavelength"
+    elif unit.is_equivalent(_SECOND):
+        return "time"
+    else:
+        return None
+
+
+@lru_cache(maxsize=64)
+def _get_unit_string(unit):
+    """
+    Format a unit for an axis label, remembering the results
+    (because astropy's LaTeX formatting isn't quick).
+
+    Parameters
+    ----------
+    unit : str, astropy.units.Unit
+        The unit to format.
+
+    Returns
+    -------
+    unit_string : str
+        The unit, formatted as inline LaTeX
+        (or "unitless" for dimensionless units).
+    """
+    unit = u.Unit(unit)
+    if unit == u.Unit(""):
+        return "unitless"
+    else:
+        return unit.to_string("latex_inline")
+
+
 def _add_panel_labels(axes, preset="inside", **kw):
     """
     Add (a), (b), (c) labels to a group of axes.
 
     Parameters
     ----------
-    ax : list or array of matplotlib.axes._subplots.AxesSubplot objects
+    axes : list or array of matplotlib.axes._subplots.AxesSubplot objects
         The axes into which the labels should be drawn.
     preset : str
         A few presets for where to put the labels relative to
@@ -74,11 +147,11 @@ def _add_panel_labels(axes, preset="inside", **kw):
         textkw.update(x=0, y=1.02, va="bottom", color="black")
     textkw.update(**kw)
 
+    # (each label stays in its own axes coordinates, so constrained
+    #  layout can still move the panels around after they're drawn)
     letters = "abcdefghijklmnopqrstuvwxyz"
-    for i, a in enumerate(axes.flatten()):
-        textkw["s"] = f"({letters[i]})"
-        textkw["transform"] = a.transAxes
-        a.text(**textkw)
+    for letter, a in zip(letters, np.ravel(axes)):
+        a.text(s=f"({letter})", transform=a.transAxes, **textkw)
 
 
 def _scatter_timelike_or_wavelike(
@@ -94,6 +167,7 @@ def _scatter_timelike_or_wavelike(
     t_unit="day",
     w_unit="micron",
     wavelength_for_color=None,
+    decimate=False,
     scatterkw={},
     **kw,
 ):
@@ -126,40 +200,103 @@ def _scatter_timelike_or_wavelike(
         It you're plotting a timelike quantity, and you want
         to set the color automatically based on wavelength,
         supply the wavelength for that color here.
+    decimate : bool
+        Should we plot only an evenly-spaced subset of the points,
+        if there are many more of them than pixels across the figure?
+        (Any per-point arrays in `kw`, like `s` or `edgecolors`,
+        will be subsampled in the same way.)
     **kw : dict
-        All additional keywords will be passed to `plt.scatter`.
+        All additional keywords will be passed to `ax.scatter`.
     """
-    with quantity_support():
-
-        # make sure ax is set up
-        if ax is None:
-            ax = plt.gca()
-        plt.sca(ax)
-
-        if x.unit.is_equivalent("m"):
-            w_unit = u.Unit(w_unit)
-            xlabel = f'{self._wave_label} ({w_unit.to_string("latex_inline")})'
-            c = self.wavelength
-        elif x.unit.is_equivalent("s"):
-            t_unit = u.Unit(t_unit)
-            xlabel = f'{self._time_label} ({t_unit.to_string("latex_inline")})'
-            c = wavelength_for_color
+    # make sure ax is set up (without changing pyplot's current axes)
+    if ax is None:
+        ax = plt.gca()
+
+    x_kind = _get_unit_kind(x.unit)
+    if x_kind == "wavelength":
+        w_unit = u.Unit(w_unit)
+        xlabel = f"{self._wave_label} ({_get_unit_string(w_unit)})"
+        x_value = x.to_value(w_unit)
+        c = self.wavelength
+    elif x_kind == "time":
+        t_unit = u.Unit(t_unit)
+        xlabel = f"{self._time_label} ({_get_unit_string(t_unit)})"
+        x_value = x.to_value(t_unit)
+        c = wavelength_for_color
+    else:
+        warnings.warn(
+            f"""
+        Your requested xaxis='{xaxis} is not allowed.
+        Please choose 'time' or 'wavelength'.
+        """
+        )
+    # (hand matplotlib plain arrays, with the colors in the same
+    #  micron units that were used to set up the wavelength norm)
+    y_value = u.Quantity(y).value
+    if c is not None:
+        c = u.Quantity(c).to_value("micron")
+    assert x_value.shape == y_value.shape
+
+    # (there's no point drawing many more points than there are pixels)
+    if decimate:
+        figure = ax.get_figure()
+        maximum_points = 4 * int(figure.get_size_inches()[0] * figure.dpi)
+        if len(x_value) > maximum_points:
+            i = np.linspace(0, len(x_value) - 1, maximum_points).astype(int)
+            x_value, y_value = x_value[i], y_value[i]
+            if np.ndim(c) > 0:
+                c = c[i]
+            kw = {
+                k: (np.asarray(v)[i] if np.shape(v)[:1] == (len(x),) else v)
+                for k, v in kw.items()
+            }
+
+    if color == "auto":
+        # make sure that the wavelength-based colormap is defined
+        self._make_sure_cmap_is_defined(cmap=cmap, vmin=vmin, vmax=vmax)
+        if (c is not None) and (np.ndim(c) == 0):
+            # (one wavelength means one color, so there's no need to colormap)
+            scatterkw = dict(color=_get_wavelength_rgba(self, c))
         else:
-            warnings.warn(
-                f"""
-            Your requested xaxis='{xaxis} is not allowed.
-            Please choose 'time' or 'wavelength'.
-            """
-            )
-        if color == "auto":
-            # make sure that the wavelength-based colormap is defined
-            self._make_sure_cmap_is_defined(cmap=cmap, vmin=vmin, vmax=vmax)
             scatterkw = dict(c=c, cmap=self.cmap, norm=self.norm)
-        else:
-            scatterkw = dict(color=color)
-        scatterkw.update(**kw)
-        assert np.shape(x) == np.shape(y)
+    else:
+        scatterkw = dict(color=color)
+    # (draw lots of points as one image, so pan/zoom/saving stay quick)
+    scatterkw["rasterized"] = np.size(x_value) > _rasterize_scatter_above
+    scatterkw.update(**kw)
+
+    ax.scatter(x_value, y_value, **scatterkw)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+
+
+def _get_wavelength_rgba(self, wavelength):
+    """
+    Get the RGBA color for one wavelength, using a table of colors
+    for all of this Rainbow's wavelengths that's only recalculated
+    if the wavelengths, cmap, or norm have been replaced.
+
+    Parameters
+    ----------
+    wavelength : float
+        The wavelength, in microns.
 
-        plt.scatter(x, y, **scatterkw)
-        plt.xlabel(xlabel)
-        plt.ylabel(ylabel)
+    Returns
+    -------
+    rgba : np.array
+        The 4-element RGBA color.
+    """
+    sources = (self.wavelength, self.cmap, self.norm)
+    cached = self.__dict__.get("_wavelength_rgba")
+    if (cached is None) or any([a is not b for a, b in zip(cached[0], sources)]):
+        w = self.wavelength.to_value("micron")
+        cached = (sources, w, self.cmap(self.norm(w)))
+        self.__dict__["_wavelength_rgba"] = cached
+    _, w, rgba = cached
+
+    # use the table if this is one of the wavelengths (otherwise, calculate it)
+    i = np.searchsorted(w, wavelength)
+    if (i < len(w)) and (w[i] == wavelength):
+        return rgba[i]
+    else:
+        return np.array(self.cmap(self.norm(wavelength)))
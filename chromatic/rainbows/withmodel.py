@@ -18,7 +18,7 @@ class RainbowWithModel(Rainbow):
         Calculate the residuals on the fly,
         to make sure they're always up to date.
         """
-        return self.flux - self.model
+        return _calculate_residuals(self.flux, self.model, 0)
 
     @property
     def residuals_plus_one(self):
@@ -26,7 +26,7 @@ class RainbowWithModel(Rainbow):
         Calculate the residuals on the fly,
         to make sure they're always up to date.
         """
-        return self.flux - self.model + 1
+        return _calculate_residuals(self.flux, self.model, 1)
 
     @property
     def ones(self):
@@ -38,10 +38,9 @@ class RainbowWithModel(Rainbow):
 
     def _validate_core_dictionaries(self):
         super()._validate_core_dictionaries()
-        try:
-            model = self.get("model")
-            assert np.shape(model) == np.shape(self.flux)
-        except (AttributeError, AssertionError):
+        # (look in fluxlike directly and compare the shape tuples)
+        model, flux = self.fluxlike.get("model"), self.fluxlike.get("flux")
+        if (model is None) or (flux is None) or (model.shape != flux.shape):
             message = """
             No fluxlike 'model' was found attached to this
             `RainbowWithModel` object. The poor thing,
@@ -61,4 +60,57 @@ class RainbowWithModel(Rainbow):
     )
 
 
+def _calculate_residuals(flux, model, offset):
+    """
+    Calculate (flux - model + offset) in one pass through memory
+    with numexpr, if it's available and the inputs are plain
+    double-precision arrays (otherwise, with numpy).
+
+    Parameters
+    ----------
+    flux : np.array, u.Quantity
+        The flux.
+    model : np.array, u.Quantity
+        The model.
+    offset : float
+        The number to add to the residuals (0 or 1).
+
+    Returns
+    -------
+    residuals : np.array, u.Quantity
+        The residuals (plus the offset).
+    """
+
+    # separate the values from their (shared) units
+    unit = getattr(flux, "unit", None)
+    flux_values = getattr(flux, "value", flux)
+    model_values = getattr(model, "value", model)
+    can_fuse = (
+        (getattr(model, "unit", None) == unit)
+        and ((unit is None) or (offset == 0) or (unit == u.dimensionless_unscaled))
+        and all([type(v) == np.ndarray for v in [flux_values, model_values]])
+        and (np.result_type(flux_values, model_values) == np.float64)
+        and (np.shape(flux_values) == np.shape(model_values))
+    )
+    if can_fuse == False:
+        residuals = np.subtract(flux, model)
+        if offset != 0:
+            residuals += offset
+        return residuals
+
+    if ne is not None:
+        residuals = ne.evaluate(
+            "flux - model + offset",
+            local_dict=dict(flux=flux_values, model=model_values, offset=offset),
+        )
+    else:
+        residuals = np.subtract(flux_values, model_values)
+        residuals += offset
+
+    if unit is None:
+        return residuals
+    else:
+        return u.Quantity(residuals, unit, copy=False)
+
+
 # REMOVE THE RAINBOW WITH MODEL AND JUST ADD A VALIDATION STEP TO ALL MODEL-DEPENDENT THINGS?
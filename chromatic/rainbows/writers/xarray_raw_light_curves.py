@@ -6,7 +6,6 @@
 # import the general list of packages
 from ...imports import *
 
-import xarray as xr
 import json
 from astropy.utils.misc import JsonCustomEncoder
 
@@ -41,6 +40,8 @@ def to_xarray_raw_light_curves(self, filepath, overwrite=True):
         The path to the file to write.
     """
 
+    import xarray as xr
+
     # warn about missing metadata
     for k in required_attrs:
         if k not in self.metadata:
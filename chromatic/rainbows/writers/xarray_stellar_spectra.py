@@ -6,7 +6,6 @@
 # import the general list of packages
 from ...imports import *
 
-import xarray as xr
 import json
 from astropy.utils.misc import JsonCustomEncoder
 
@@ -33,6 +32,8 @@ def to_xarray_stellar_spectra(self, filepath, overwrite=True):
         The path to the file to write.
     """
 
+    import xarray as xr
+
     # warn about missing metadata
     for k in required_attrs:
         if k not in self.metadata:
@@ -34,6 +34,38 @@ def test_rainbow_basics():
     )
 
 
+def test_equality():
+    a = SimulatedRainbow(R=10).inject_noise()
+    assert a == a._create_copy()
+
+    # any difference in the core dictionaries should count
+    for change in ["fluxlike", "timelike", "wavelike"]:
+        b = a._create_copy()
+        if change == "fluxlike":
+            b.fluxlike["flux"] = b.flux * 2
+        elif change == "timelike":
+            b.timelike["extra"] = np.ones(b.ntime)
+        elif change == "wavelike":
+            b.wavelike["wavelength"] = b.wavelength * 2
+        assert a != b
+
+    # (but the metadata are skipped)
+    b = a._create_copy()
+    b.metadata["extra"] = "different"
+    assert a == b
+
+
+def test_expand_filenames():
+    filenames = []
+    for name in ["c", "a", "b"]:
+        filenames.append(os.path.join(test_directory, f"expand-{name}.txt"))
+        open(filenames[-1], "w").close()
+    expected = sorted(filenames)
+    assert expand_filenames(filenames) == expected
+    assert expand_filenames(os.path.join(test_directory, "expand-*.txt")) == expected
+    assert expand_filenames(filenames[0]) == [filenames[0]]
+
+
 def test_essential_properties():
     # create a simulated rainbow
     r = SimulatedRainbow().inject_noise()
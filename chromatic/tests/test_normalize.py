@@ -1,4 +1,5 @@
 from ..rainbows import *
+from ..percentiles import *
 from .setup_tests import *
 
 
@@ -40,3 +41,28 @@ def test_is_probably_normalized():
         SimulatedRainbow(**kw).inject_noise().normalize()._is_probably_normalized()
         == True
     )
+
+    # a small offset is still too big, relative to very small noise
+    s = SimulatedRainbow(R=20, dt=5 * u.minute).inject_transit()
+    quiet = s.inject_noise(signal_to_noise=200)
+    assert quiet._is_probably_normalized() == True
+    assert (quiet + 0.05)._is_probably_normalized() == False
+
+
+@pytest.mark.parametrize("use_numba_above", [0, 50_000_000])
+def test_nanpercentile(use_numba_above, monkeypatch):
+    # (a threshold of 0 makes even this small array use the numba kernel)
+    monkeypatch.setattr("chromatic.percentiles._use_numba_above", use_numba_above)
+    x = np.random.normal(0, 1, (37, 113))
+    x[x > 2] = np.nan
+    x[3, :] = np.nan
+    for axis in [0, 1]:
+        for q in [0, 16, 50, 84, 100]:
+            expected = np.nanpercentile(x, q, axis=axis)
+            assert np.allclose(nanpercentile(x, q, axis=axis), expected, equal_nan=True)
+    assert nanpercentile(x * u.W, 50, axis=1).unit == u.W
+
+    # percentiles outside 0-100 should raise the same errors as numpy
+    for q in [-5, 150]:
+        with pytest.raises(ValueError):
+            nanpercentile(x, q, axis=1)
@@ -85,3 +85,41 @@ def test_operations_with_uncertainty():
 
         scaled_sigma = np.std(r.residuals / r.uncertainty)
         assert np.isclose(scaled_sigma, 1, rtol=0.02)
+
+
+@pytest.mark.parametrize("use_numexpr", [True, False])
+def test_operations_match_numpy(use_numexpr, monkeypatch):
+    from ..rainbows.actions import operations
+
+    if use_numexpr == False:
+        monkeypatch.setattr(operations, "ne", None)
+
+    a = SimulatedRainbow(R=10).inject_noise(signal_to_noise=100) + 1
+    b = SimulatedRainbow(R=10).inject_noise(signal_to_noise=50) * 0.5
+    x, sx = a.flux.copy(), a.uncertainty.copy()
+    y, sy = b.flux.copy(), b.uncertainty.copy()
+
+    # (uncertainties are propagated with the models, which are noiseless)
+    xm, ym = a.model, b.model
+    expected = {
+        "+": (x + y, np.sqrt(sx**2 + sy**2)),
+        "-": (x - y, np.sqrt(sx**2 + sy**2)),
+        "*": (x * y, np.sqrt((sx * ym) ** 2 + (sy * xm) ** 2)),
+        "/": (x / y, np.sqrt((sx / ym) ** 2 + (sy * xm / ym**2) ** 2)),
+    }
+    for symbol, (flux, uncertainty) in expected.items():
+        r = eval(f"a {symbol} b")
+        assert np.allclose(r.flux, flux)
+        assert np.allclose(r.uncertainty, uncertainty)
+
+        # math with an array or a number shouldn't change its uncertainty
+        for other in [y, y[:, 0], y[0, :], 2.0]:
+            other_like = a._broadcast_to_fluxlike(other)
+            r = eval(f"a {symbol} other")
+            assert np.allclose(r.flux, eval(f"x {symbol} other_like"))
+            dzdx = {"+": 1, "-": 1, "*": other_like, "/": 1 / other_like}[symbol]
+            assert np.allclose(r.uncertainty, sx * np.abs(dzdx))
+
+    # none of this should have changed the original Rainbows
+    assert np.all(a.flux == x) and np.all(a.uncertainty == sx)
+    assert np.all(b.flux == y) and np.all(b.uncertainty == sy)
@@ -1,5 +1,7 @@
 from ..rainbows import *
 from .setup_tests import *
+from ..rainbows.actions.remove_trends import _median_filter
+from scipy.ndimage import median_filter
 
 
 def test_remove_trends():
@@ -33,3 +35,35 @@ def test_remove_trends():
     x.plot_noise_comparison(ax=ax[1, -1])
     plt.ylim(0, 0.02)
     plt.savefig(os.path.join(test_directory, "test-remove_trends.png"))
+
+
+def test_median_filter():
+    flux = np.random.normal(1, 0.01, (5, 50))
+    for size in [(1, 11), (1, 4), (3, 5)]:
+        assert np.all(_median_filter(flux, size=size) == median_filter(flux, size=size))
+
+    # nans should be treated just the way scipy treats them
+    flux[2, [3, 20, 21]] = np.nan
+    expected = median_filter(flux, size=(1, 11))
+    assert np.array_equal(_median_filter(flux, size=(1, 11)), expected, equal_nan=True)
+
+
+def test_remove_trends_values():
+    s = SimulatedRainbow(R=10).inject_noise()
+    original = s.flux.copy()
+
+    # differences should match the gradient along wavelength
+    x = s.remove_trends(method="differences")
+    assert np.allclose(x.flux, np.sqrt(2) * np.gradient(original, axis=0) + 1)
+
+    # the filters should divide out the same trend that scipy finds
+    x = s.remove_trends(method="median_filter", size=(1, 5))
+    assert np.allclose(x.flux, original / median_filter(original, size=(1, 5)))
+    from scipy.signal import savgol_filter
+
+    x = s.remove_trends(method="savgol_filter", window_length=7, polyorder=2)
+    trend = savgol_filter(original, window_length=7, polyorder=2, axis=1)
+    assert np.allclose(x.flux, original / trend)
+
+    # none of these should have changed the original Rainbow
+    assert np.all(s.flux == original)
@@ -1,6 +1,10 @@
 from ..rainbows import *
 from .setup_tests import *
 from ..rainbows.visualizations import _add_panel_labels
+from ..rainbows.visualizations.utilities import (
+    _get_wavelength_rgba,
+    _get_animation_writer_and_displayer,
+)
 
 
 def test_imshow():
@@ -36,6 +40,47 @@ def test_plot():
     plt.savefig(os.path.join(test_directory, "plot-demonstration.pdf"))
 
 
+def test_plot_lightcurves_unsorted_times():
+    s = SimulatedRainbow(R=5).inject_noise()
+    i = np.arange(s.ntime)
+    i[0], i[1] = 1, 0
+    unsorted = s._create_copy()
+    unsorted.timelike["time"] = s.time[i]
+    ax = unsorted.plot_lightcurves()
+    earliest = np.min(s.time.to_value("day"))
+    assert all([t.get_position()[0] == earliest for t in ax.texts])
+    plt.close("all")
+
+
+def test_plot_lightcurves_errorbarkw():
+    s = SimulatedRainbow(R=5).inject_noise()
+    ax = s.plot_lightcurves(errorbarkw=dict(elinewidth=3, color="orchid", alpha=0.5))
+    errorbars = ax.collections[0]
+    assert len(errorbars.get_segments()) == s.nwave * s.ntime
+    assert np.all(errorbars.get_linewidths() == 3)
+    assert errorbars.get_alpha() == 0.5
+
+    # keywords that only `plt.errorbar` understands should just be ignored
+    with pytest.warns(UserWarning, match="capsize"):
+        s.plot_lightcurves(errorbarkw=dict(capsize=3, fmt="o", barsabove=True))
+    plt.close("all")
+
+
+def test_plot_lightcurves_with_bad_data():
+    s = SimulatedRainbow(R=5).inject_noise()
+    s.fluxlike["ok"] = np.ones(s.shape, bool)
+    s.fluxlike["ok"][0, ::2] = False
+    s.fluxlike["ok"][1, :] = False
+
+    # lines should connect across bad points, and skip entirely bad light curves
+    ax = s.plot_lightcurves(plotkw=dict(marker=None), errorbar=False)
+    lines = ax.collections[0].get_segments()
+    assert len(lines) == s.nwave - 1
+    assert len(lines[0]) == np.sum(s.ok[0])
+    assert np.all(np.isfinite(lines[0]))
+    plt.close("all")
+
+
 def test_plot_unnormalized():
     w = np.logspace(0, 1, 5) * u.micron
     plt.figure()
@@ -113,6 +158,15 @@ def test_cmap():
     assert r.get_wavelength_color(r.wavelength[0]) == (0.0, 0.0, 0.0, 1.0)
     assert r.get_wavelength_color(r.wavelength[-1]) == (1.0, 0.0, 0.0, 1.0)
 
+    # the same colormap should be reused, not made again
+    assert one2another("black", "red") is one2another("black", "red")
+
+    # single-wavelength colors should match the colormap, in or out of the table
+    for w in [r.wavelength[3], np.mean(r.wavelength[3:5])]:
+        w = w.to_value("micron")
+        expected = r.cmap(r.norm(w))
+        assert np.allclose(_get_wavelength_rgba(r, w), expected)
+
 
 def test_imshow_interact():
     plt.figure()
@@ -227,6 +281,9 @@ def test_both_types_of_plot():
 def test_add_labels_to_panels():
     fi, ax = plt.subplots(3, 3)
     _add_panel_labels(ax, preset="inside", color="blue")
+    for letter, a in zip("abcdefghi", ax.flatten()):
+        assert [t.get_text() for t in a.texts] == [f"({letter})"]
+        assert a.texts[0].get_color() == "blue"
 
 
 def test_pcolormesh():
@@ -268,3 +325,55 @@ def test_plot_noise_comparison():
     ax[0, 0].set_title("No Systematics")
     ax[0, 1].set_title("With Systematics")
     plt.savefig(os.path.join(test_directory, "test-plot_noise_comparison.png"))
+
+
+def test_plot_average_lightcurve_and_spectrum():
+    s = SimulatedRainbow().inject_noise()
+    fi, ax = plt.subplots(1, 2, constrained_layout=True)
+
+    # plotting again into the same axes should add points, not move them
+    s.plot_average_lightcurve(ax=ax[0])
+    s.plot_average_lightcurve(ax=ax[0], marker="x")
+    assert len(ax[0].collections) == 2
+    s.plot_average_spectrum(ax=ax[1])
+    s.plot_average_spectrum(ax=ax[1])
+    assert len(ax[1].collections) == 2
+
+    # the plotted light curve should notice edits made inside the flux
+    s.flux[:, 0] = 2
+    s.plot_average_lightcurve(ax=ax[0])
+    assert ax[0].collections[-1].get_offsets()[0, 1] == 2
+    plt.savefig(
+        os.path.join(test_directory, "test-plot_average_lightcurve_and_spectrum.png")
+    )
+
+
+def test_plot_average_spectrum_decimated():
+    w = np.linspace(1, 5, 2000) * u.micron
+    t = np.linspace(-1, 1, 3) * u.hour
+    s = Rainbow(wavelength=w, time=t, flux=np.ones((len(w), len(t))))
+    fi, ax = plt.subplots(1, 2, figsize=(2, 1), dpi=100)
+
+    # every point should be drawn, unless we ask for decimation
+    s.plot_average_spectrum(ax=ax[0])
+    assert len(ax[0].collections[0].get_offsets()) == s.nwave
+    sizes = np.linspace(1, 2, s.nwave)
+    s.plot_average_spectrum(ax=ax[1], decimate=True, s=sizes)
+    scatter = ax[1].collections[0]
+    assert len(scatter.get_offsets()) == 4 * 200
+    assert len(scatter.get_sizes()) == 4 * 200
+    assert len(scatter.get_array()) == 4 * 200
+
+    # only scatters with lots of points should be rasterized
+    assert ax[0].collections[0].get_rasterized() == False
+    w = np.linspace(1, 5, 6000) * u.micron
+    many = Rainbow(wavelength=w, time=t, flux=np.ones((len(w), len(t))))
+    many.plot_average_spectrum(ax=ax[0])
+    assert ax[0].collections[-1].get_rasterized() == True
+
+
+def test_animation_writers():
+    writer, displayer = _get_animation_writer_and_displayer("animation.gif", fps=5)
+    assert type(writer).__name__ == "PillowWriter"
+    writer, displayer = _get_animation_writer_and_displayer("animation.html")
+    assert type(writer).__name__ == "HTMLWriter"
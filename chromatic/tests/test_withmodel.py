@@ -18,6 +18,44 @@ def test_attach_model():
     assert withmodel == original
 
 
+def test_missing_model_warning():
+    s = SimulatedRainbow()
+    with pytest.warns(UserWarning, match="name is a lie"):
+        RainbowWithModel(wavelength=s.wavelength, time=s.time, flux=s.flux)
+    with warnings.catch_warnings():
+        warnings.filterwarnings("error", message=".*name is a lie")
+        RainbowWithModel(
+            wavelength=s.wavelength, time=s.time, flux=s.flux, model=s.model
+        )
+
+
+def test_residuals():
+    s = SimulatedRainbow().inject_noise().inject_transit()
+    assert np.all(s.residuals == s.flux - s.model)
+    assert np.allclose(s.residuals_plus_one, s.flux - s.model + 1)
+
+    # the residuals should notice edits made inside flux and model
+    s.flux[0, 0] = 100
+    s.model[1, 1] = -100
+    assert np.all(s.residuals == s.flux - s.model)
+    assert np.allclose(s.residuals[0, 0], 100 - s.model[0, 0])
+    assert np.allclose(s.residuals_plus_one[1, 1], s.flux[1, 1] + 101)
+
+    # and they should still be arrays we can change
+    residuals = s.residuals
+    residuals[0, 0] = 0
+    s.residuals_plus_one[0, 0] = 0
+
+
+def test_ones():
+    s = SimulatedRainbow().inject_noise().inject_transit()
+    ones = s.ones
+    assert ones.shape == s.shape
+    assert np.all(ones == 1)
+    ones[0, 0] = 2
+    assert np.all(s.ones == 1)
+
+
 def test_imshow_with_models():
     s = (
         SimulatedRainbow()
@@ -81,7 +81,7 @@ setup(
     # what other packages are needed? (must be pip-installable)
     install_requires=[
         "numpy",
-        "scipy",
+        "scipy>=1.5",
         "matplotlib>=3.5",
         "astropy>=5.0",
         "pandas",
@@ -109,6 +109,7 @@ setup(
             "pre-commit",
         ],
         "cartoons": ["rainbow-connection>=0.0.7"],
+        "speedups": ["numba", "numexpr", "bottleneck"],
     },
     # (I think just leave this set to False)
     zip_safe=False,